@@ -1,608 +1,1182 @@
-# app.py
-"""
-BankSight — Full Streamlit dashboard (single-file, multipage)
-Features:
- - Auto-create SQLite DB on first run from data/ CSVs & JSONs
- - View Tables (all datasets)
- - Filter Data (multi-column filters)
- - CRUD operations (create/read/update/delete)
- - Credit/Debit simulation (with min balance enforcement)
- - Analytical Insights (15 SQL queries)
- - Intro & About pages
-
-Place your source files in ./data:
- - customers.csv
- - accounts.csv
- - transactions.csv
- - branches.json
- - loans.json
- - credit_cards.json
- - support_tickets.json
-
-Run:
-    streamlit run app.py
-"""
-
-import streamlit as st
-import pandas as pd
-import json
-from pathlib import Path
-from sqlalchemy import create_engine, text
-import sqlite3
-import datetime
-
-# ---------------------------
-# Paths & DB connection setup
-# ---------------------------
-BASE_DIR = Path(__file__).resolve().parent
-DATA_DIR = BASE_DIR / "data"
-DB_PATH = BASE_DIR / "banksight.db"
-
-def get_engine():
-    # Use absolute path to avoid relative-path issues when running Streamlit
-    return create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False})
-
-# ---------------------------
-# Utilities: JSON reader (handles JSON or JSON lines)
-# ---------------------------
-def read_json_file(path: Path) -> pd.DataFrame:
-    """Read JSON file. Supports standard JSON array or newline-delimited JSON (ndjson)."""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        df = pd.json_normalize(data)
-        return df
-    except json.JSONDecodeError:
-        # try JSON lines
-        records = []
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    records.append(json.loads(line))
-                except Exception:
-                    # skip bad line
-                    continue
-        return pd.json_normalize(records)
-
-# ---------------------------
-# Auto-create DB if missing
-# ---------------------------
-def create_database_from_data():
-    """Create banksight.db from CSV and JSON files in data/ if DB does not exist."""
-    if DB_PATH.exists():
-        return False  # DB already exists -> nothing to do
-
-    # Make sure data dir exists
-    if not DATA_DIR.exists():
-        st.warning(f"Data folder not found at {DATA_DIR}. Place your CSV/JSON files there.")
-        return False
-
-    engine = get_engine()
-
-    # Expected files and table mapping
-    csv_files = {
-        "customers.csv": "customers",
-        "accounts.csv": "accounts",
-        "transactions.csv": "transactions",
-    }
-    json_files = {
-        "branches.json": "branches",
-        "loans.json": "loans",
-        "credit_cards.json": "credit_cards",
-        "support_tickets.json": "support_tickets",
-    }
-
-    # Load CSVs
-    for fname, table in csv_files.items():
-        p = DATA_DIR / fname
-        if p.exists():
-            try:
-                df = pd.read_csv(p)
-                # Basic cleaning: ensure columns lowercase / consistent
-                df.columns = [c.strip() for c in df.columns]
-                df.to_sql(table, engine, index=False, if_exists="replace")
-            except Exception as e:
-                st.error(f"Failed to load {fname}: {e}")
-        else:
-            st.warning(f"{fname} not found in data/ — {table} table will not be created.")
-
-    # Load JSONs
-    for fname, table in json_files.items():
-        p = DATA_DIR / fname
-        if p.exists():
-            try:
-                df = read_json_file(p)
-                df.columns = [c.strip() for c in df.columns]
-                df.to_sql(table, engine, index=False, if_exists="replace")
-            except Exception as e:
-                st.error(f"Failed to load {fname}: {e}")
-        else:
-            st.warning(f"{fname} not found in data/ — {table} table will not be created.")
-
-    # Create helpful indexes (optional, will not fail if columns missing)
-    with engine.connect() as conn:
-        try:
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_accounts_customer ON accounts(customer_id);"))
-        except Exception:
-            pass
-        try:
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_txn_customer ON transactions(customer_id);"))
-        except Exception:
-            pass
-
-    st.success(f"Database created at {DB_PATH}")
-    return True
-
-# ---------------------------
-# Cached DB reads (do NOT pass engine as a parameter)
-# ---------------------------
-@st.cache_data(show_spinner=False)
-def read_table(table_name: str, limit: int = 1000) -> pd.DataFrame:
-    """Read a table from the DB (cached). Do not pass 'engine' to avoid hashing issues."""
-    engine = get_engine()
-    query = f"SELECT * FROM {table_name} LIMIT {limit}"
-    try:
-        df = pd.read_sql_query(text(query), engine)
-    except Exception:
-        # Return empty DF if table missing
-        df = pd.DataFrame()
-    return df
-
-@st.cache_data(show_spinner=False)
-def read_sql_query(query: str) -> pd.DataFrame:
-    engine = get_engine()
-    try:
-        return pd.read_sql_query(text(query), engine)
-    except Exception:
-        return pd.DataFrame()
-
-# ---------------------------
-# CRUD helpers
-# ---------------------------
-def insert_record(table: str, record: dict):
-    engine = get_engine()
-    cols = ", ".join(record.keys())
-    vals = ", ".join([f":{k}" for k in record.keys()])
-    stmt = text(f"INSERT INTO {table} ({cols}) VALUES ({vals})")
-    with engine.begin() as conn:
-        conn.execute(stmt, record)
-    # clear cache
-    read_table.clear()
-    read_sql_query.clear()
-
-def update_record(table: str, pk_col: str, pk_val, updates: dict):
-    engine = get_engine()
-    set_clause = ", ".join([f"{k} = :{k}" for k in updates.keys()])
-    params = updates.copy()
-    params["pk_val"] = pk_val
-    stmt = text(f"UPDATE {table} SET {set_clause} WHERE {pk_col} = :pk_val")
-    with engine.begin() as conn:
-        conn.execute(stmt, params)
-    read_table.clear()
-    read_sql_query.clear()
-
-def delete_record(table: str, pk_col: str, pk_val):
-    engine = get_engine()
-    stmt = text(f"DELETE FROM {table} WHERE {pk_col} = :v")
-    with engine.begin() as conn:
-        conn.execute(stmt, {"v": pk_val})
-    read_table.clear()
-    read_sql_query.clear()
-
-# ---------------------------
-# Analytical SQL queries (Q1..Q15)
-# ---------------------------
-SQL_QUERIES = {
-    "Q1: Customers per city & avg balance":
-        """
-        SELECT c.city,
-               COUNT(*) AS total_customers,
-               ROUND(AVG(a.account_balance),2) AS avg_balance
-        FROM customers c
-        JOIN accounts a ON c.customer_id = a.customer_id
-        GROUP BY c.city
-        ORDER BY avg_balance DESC;
-        """,
-
-    "Q2: Account type holding highest total balance":
-        """
-        SELECT c.account_type,
-               SUM(a.account_balance) AS total_balance
-        FROM customers c
-        JOIN accounts a ON c.customer_id = a.customer_id
-        GROUP BY c.account_type
-        ORDER BY total_balance DESC;
-        """,
-
-    "Q3: Top 10 customers by total balance":
-        """
-        SELECT c.customer_id, c.name, c.city, a.account_balance
-        FROM customers c
-        JOIN accounts a ON c.customer_id = a.customer_id
-        ORDER BY a.account_balance DESC
-        LIMIT 10;
-        """,
-
-    "Q4: Customers in 2023 with balance > 100000":
-        """
-        SELECT c.customer_id, c.name, c.city, c.join_date, a.account_balance
-        FROM customers c
-        JOIN accounts a ON c.customer_id = a.customer_id
-        WHERE c.join_date LIKE '2023%' AND a.account_balance > 100000;
-        """,
-
-    "Q5: Total transaction volume by type":
-        """
-        SELECT txn_type, SUM(amount) AS total_volume
-        FROM transactions
-        GROUP BY txn_type
-        ORDER BY total_volume DESC;
-        """,
-
-    "Q6: Accounts with >3 failed txns in a month":
-        """
-        SELECT customer_id, strftime('%Y-%m', txn_time) AS month, COUNT(*) AS failed_count
-        FROM transactions
-        WHERE LOWER(status) = 'failed'
-        GROUP BY customer_id, month
-        HAVING COUNT(*) > 3;
-        """,
-
-    "Q7: Top 5 branches by txn volume (last 6 months)":
-        """
-        SELECT b.Branch_Name, SUM(t.amount) AS total_volume
-        FROM transactions t
-        JOIN customers c ON t.customer_id = c.customer_id
-        JOIN branches b ON c.city = b.City
-        WHERE DATE(t.txn_time) >= DATE('now','-6 months')
-        GROUP BY b.Branch_Name
-        ORDER BY total_volume DESC
-        LIMIT 5;
-        """,
-
-    "Q8: Accounts with >=5 high-value txns (>200000)":
-        """
-        SELECT customer_id, COUNT(*) AS high_value_count
-        FROM transactions
-        WHERE amount > 200000
-        GROUP BY customer_id
-        HAVING COUNT(*) >= 5;
-        """,
-
-    "Q9: Avg loan amount & interest by loan type":
-        """
-        SELECT Loan_Type, AVG(Loan_Amount) AS avg_amount, AVG(Interest_Rate) AS avg_rate
-        FROM loans
-        GROUP BY Loan_Type;
-        """,
-
-    "Q10: Customers holding >1 active/approved loan":
-        """
-        SELECT Customer_ID, COUNT(*) AS active_loans
-        FROM loans
-        WHERE Loan_Status IN ('Active', 'Approved')
-        GROUP BY Customer_ID
-        HAVING COUNT(*) > 1;
-        """,
-
-    "Q11: Top 5 customers with highest outstanding loan amount":
-        """
-        SELECT Customer_ID, SUM(Loan_Amount) AS total_outstanding
-        FROM loans
-        WHERE Loan_Status != 'Closed'
-        GROUP BY Customer_ID
-        ORDER BY total_outstanding DESC
-        LIMIT 5;
-        """,
-
-    "Q12: Branch with highest total account balance":
-        """
-        SELECT b.Branch_Name, SUM(a.account_balance) AS total_balance
-        FROM accounts a
-        JOIN customers c ON a.customer_id = c.customer_id
-        JOIN branches b ON c.city = b.City
-        GROUP BY b.Branch_Name
-        ORDER BY total_balance DESC
-        LIMIT 1;
-        """,
-
-    "Q13: Branch performance summary":
-        """
-        SELECT b.Branch_Name,
-               COUNT(DISTINCT c.customer_id) AS total_customers,
-               COUNT(DISTINCT l.Loan_ID) AS total_loans,
-               COALESCE(SUM(t.amount),0) AS transaction_volume
-        FROM branches b
-        LEFT JOIN customers c ON c.city = b.City
-        LEFT JOIN loans l ON l.Branch = b.Branch_Name OR l.Branch = b.City
-        LEFT JOIN transactions t ON t.customer_id = c.customer_id
-        GROUP BY b.Branch_Name;
-        """,
-
-    "Q14: Issue categories with longest avg resolution time":
-        """
-        SELECT Issue_Category,
-               AVG(julianday(Date_Closed) - julianday(Date_Opened)) AS avg_days
-        FROM support_tickets
-        WHERE Date_Closed IS NOT NULL
-        GROUP BY Issue_Category
-        ORDER BY avg_days DESC;
-        """,
-
-    "Q15: Support agents resolving most critical tickets (rating >=4)":
-        """
-        SELECT Support_Agent, COUNT(*) AS resolved_critical
-        FROM support_tickets
-        WHERE Priority = 'Critical' AND Customer_Rating >= 4
-        GROUP BY Support_Agent
-        ORDER BY resolved_critical DESC;
-        """
-}
-
-# ---------------------------
-# Streamlit UI
-# ---------------------------
-st.set_page_config(page_title="BankSight", layout="wide")
-st.title("🏦 BankSight: Transaction Intelligence Dashboard")
-
-# Auto-create DB if missing (runs once)
-if not DB_PATH.exists():
-    with st.spinner("Creating SQLite database from data/ — this runs only on first start..."):
-        created = create_database_from_data()
-        if not created:
-            st.warning("Database was not created. Fix data in data/ folder and refresh.")
-else:
-    # show small note
-    st.info("Using existing database at " + str(DB_PATH))
-
-# Sidebar navigation (multipage)
-page = st.sidebar.radio("Navigation", [
-    "🏠 Introduction",
-    "📊 View Tables",
-    "🔍 Filter Data",
-    "✏️ CRUD Operations",
-    "💰 Credit / Debit Simulation",
-    "🧠 Analytical Insights",
-    "👩‍💻 About Creator"
-])
-
-# ---------------------------
-# Page: Introduction
-# ---------------------------
-if page == "🏠 Introduction":
-    st.header("BankSight — Transaction Intelligence Dashboard")
-    st.markdown("""
-    **Purpose:** Explore customers, accounts, transactions, loans, credit cards, branches, and support tickets.
-    This dashboard reads from a local SQLite database (created from files in `data/`).
-    """)
-    st.markdown("**Datasets included:** customers, accounts, transactions, branches, loans, credit_cards, support_tickets.")
-    st.markdown("Use the left sidebar to navigate between pages.")
-
-# ---------------------------
-# Page: View Tables
-# ---------------------------
-elif page == "📊 View Tables":
-    st.header("📊 View Tables")
-    tables_available = []
-    # check what tables exist
-    engine = get_engine()
-    with engine.connect() as conn:
-        res = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))
-        tables_available = [r[0] for r in res.fetchall()]
-    st.write("Available tables:", tables_available)
-
-    selected = st.selectbox("Select table to view", options=tables_available if tables_available else ["customers", "accounts", "transactions"])
-    limit = st.number_input("Rows to load", min_value=50, max_value=200000, value=1000, step=50)
-    df = read_table(selected, limit=int(limit))
-    if df.empty:
-        st.warning("No data found in table: " + selected)
-    else:
-        st.dataframe(df)
-        st.download_button("⬇️ Download CSV", df.to_csv(index=False).encode(), f"{selected}.csv", "text/csv")
-
-# ---------------------------
-# Page: Filter Data
-# ---------------------------
-elif page == "🔍 Filter Data":
-    st.header("🔍 Filter Data (multi-column filters)")
-    # let user choose a table
-    engine = get_engine()
-    with engine.connect() as conn:
-        res = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))
-        tables = [r[0] for r in res.fetchall()]
-    table = st.selectbox("Choose dataset", tables)
-    # load moderate-sized df
-    df = read_table(table, limit=50000)
-    if df.empty:
-        st.warning("No data to filter for table: " + table)
-    else:
-        st.write("Columns:", df.columns.tolist())
-        # choose columns to show
-        show_cols = st.multiselect("Columns to show", options=df.columns.tolist(), default=df.columns.tolist()[:6])
-        # build filters
-        filters = {}
-        for col in show_cols:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                mn = float(df[col].min(skipna=True)) if pd.notna(df[col].min(skipna=True)) else 0.0
-                mx = float(df[col].max(skipna=True)) if pd.notna(df[col].max(skipna=True)) else 0.0
-                r = st.slider(f"{col} range", mn, mx, (mn, mx))
-                filters[col] = lambda d, c=col, r=r: d[(d[c] >= r[0]) & (d[c] <= r[1])]
-            elif pd.api.types.is_datetime64_any_dtype(df[col]) or "date" in col.lower() or "time" in col.lower():
-                dmin = pd.to_datetime(df[col], errors='coerce').min()
-                dmax = pd.to_datetime(df[col], errors='coerce').max()
-                start = st.date_input(f"{col} start", value=(dmin.date() if pd.notna(dmin) else datetime.date.today()))
-                end = st.date_input(f"{col} end", value=(dmax.date() if pd.notna(dmax) else datetime.date.today()))
-                filters[col] = lambda d, c=col, s=start, e=end: d[(pd.to_datetime(d[c]).dt.date >= s) & (pd.to_datetime(d[c]).dt.date <= e)]
-            else:
-                vals = df[col].dropna().unique().tolist()[:200]
-                sel = st.multiselect(f"{col} values", options=vals, default=vals[:5] if vals else [])
-                if sel:
-                    filters[col] = lambda d, c=col, sel=sel: d[d[c].isin(sel)]
-        # apply filters
-        result = df.copy()
-        for f in filters.values():
-            result = f(result)
-        st.write(f"Filtered rows: {len(result)}")
-        st.dataframe(result[show_cols])
-
-# ---------------------------
-# Page: CRUD Operations
-# ---------------------------
-elif page == "✏️ CRUD Operations":
-    st.header("✏️ CRUD Operations")
-    engine = get_engine()
-    with engine.connect() as conn:
-        res = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))
-        tables = [r[0] for r in res.fetchall()]
-
-    table = st.selectbox("Choose table for CRUD", options=tables)
-    mode = st.radio("Operation", ["Create", "Read", "Update", "Delete"])
-    schema_df = read_sql_query(f"PRAGMA table_info({table});")
-    cols = [row['name'] for _, row in schema_df.iterrows()] if not schema_df.empty else []
-
-    if mode == "Create":
-        st.subheader("Create new record")
-        new = {}
-        for c in cols:
-            new[c] = st.text_input(c, key=f"create_{c}")
-        if st.button("Insert record"):
-            # remove empty keys if primary autoinc should be skipped
-            payload = {k: v for k, v in new.items() if v != ""}
-            try:
-                insert_record(table, payload)
-                st.success("Inserted record.")
-            except Exception as e:
-                st.error("Insert failed: " + str(e))
-
-    elif mode == "Read":
-        st.subheader("Read / Browse")
-        limit = st.number_input("Rows", 10, 10000, 500)
-        df = read_table(table, limit=int(limit))
-        st.dataframe(df)
-
-    elif mode == "Update":
-        st.subheader("Update record by primary key")
-        # Attempt to find a primary key column (heuristic)
-        pk_col = None
-        if not schema_df.empty:
-            for _, row in schema_df.iterrows():
-                if row.get('pk') == 1 or row.get('pk') == '1' or 'id' in row['name'].lower():
-                    pk_col = row['name']
-                    break
-        if not pk_col and cols:
-            pk_col = cols[0]  # fallback
-        st.write("Primary key column used:", pk_col)
-        pk_val = st.text_input("Primary key value to update")
-        updates = {}
-        for c in cols:
-            if c == pk_col: 
-                continue
-            updates[c] = st.text_input(f"New value for {c}", key=f"upd_{c}")
-        if st.button("Execute update"):
-            # prepare only non-empty updates
-            upd_payload = {k: v for k, v in updates.items() if v != ""}
-            try:
-                update_record(table, pk_col, pk_val, upd_payload)
-                st.success("Updated successfully.")
-            except Exception as e:
-                st.error("Update failed: " + str(e))
-
-    elif mode == "Delete":
-        st.subheader("Delete record by primary key")
-        # use same pk_col heuristic
-        pk_col = None
-        if not schema_df.empty:
-            for _, row in schema_df.iterrows():
-                if row.get('pk') == 1 or 'id' in row['name'].lower():
-                    pk_col = row['name']
-                    break
-        if not pk_col and cols:
-            pk_col = cols[0]
-        st.write("Primary key column used:", pk_col)
-        pk_val = st.text_input("Primary key value to delete")
-        if st.button("Delete"):
-            try:
-                delete_record(table, pk_col, pk_val)
-                st.success("Deleted (if existed).")
-            except Exception as e:
-                st.error("Delete failed: " + str(e))
-
-# ---------------------------
-# Page: Credit / Debit Simulation
-# ---------------------------
-elif page == "💰 Credit / Debit Simulation":
-    st.header("💰 Credit / Debit Simulation")
-    st.markdown("Enter a `customer_id` to load the account balance, then deposit or withdraw (simulation updates DB).")
-
-    cid = st.text_input("Customer ID")
-    if st.button("Load balance"):
-        df_acc = read_sql_query(f"SELECT * FROM accounts WHERE customer_id = '{cid}'")
-        if df_acc.empty:
-            st.error("Account not found for customer_id: " + str(cid))
-        else:
-            st.session_state["curr_balance"] = float(df_acc.iloc[0]["account_balance"])
-            st.success(f"Loaded balance: ₹{st.session_state['curr_balance']:.2f}")
-
-    amt = st.number_input("Amount", min_value=0.0, format="%.2f")
-    op = st.selectbox("Operation", ["Deposit", "Withdraw"])
-    if st.button("Execute transaction"):
-        if "curr_balance" not in st.session_state:
-            st.error("Load balance first")
-        else:
-            cur = st.session_state["curr_balance"]
-            if op == "Deposit":
-                newbal = cur + amt
-            else:
-                newbal = cur - amt
-                if newbal < 1000:
-                    st.error("Minimum balance ₹1000 would be violated. Operation aborted.")
-                    newbal = cur
-            if newbal != cur:
-                try:
-                    engine = get_engine()
-                    with engine.begin() as conn:
-                        conn.execute(text("UPDATE accounts SET account_balance = :bal, last_updated = :dt WHERE customer_id = :cid"),
-                                     {"bal": newbal, "dt": datetime.datetime.utcnow().isoformat(), "cid": cid})
-                    st.session_state["curr_balance"] = newbal
-                    read_table.clear()
-                    read_sql_query.clear()
-                    st.success(f"Balance updated: ₹{newbal:.2f}")
-                except Exception as e:
-                    st.error("Failed to update balance: " + str(e))
-
-# ---------------------------
-# Page: Analytical Insights
-# ---------------------------
-elif page == "🧠 Analytical Insights":
-    st.header("🧠 Analytical Insights (select a question)")
-    selected = st.selectbox("Choose insight", list(SQL_QUERIES.keys()))
-    if selected:
-        q = SQL_QUERIES[selected]
-        st.code(q)
-        dfq = read_sql_query(q)
-        if dfq.empty:
-            st.warning("Query returned no rows (or table missing).")
-        else:
-            st.dataframe(dfq)
-            st.download_button("⬇️ Download result as CSV", dfq.to_csv(index=False).encode(), "insight.csv", "text/csv")
-
-# ---------------------------
-# Page: About Creator
-# ---------------------------
-elif page == "👩‍💻 About Creator":
-    st.header("About / Contact")
-    st.markdown("""
-    **Creator:** Devendra Kumar
-    
-    **Skills:** Python, SQL, Streamlit, Data Analysis, Banking Analytics
-    
-    **Contact:** devendragkp45@gmail.com
-    """)
-    st.info("This app is a demo. Do not store production PII in a public repo.")
-
-# ---------------------------
-# End of app
-# ---------------------------
+# app.py
+"""
+BankSight — Full Streamlit dashboard (single-file, multipage)
+Features:
+ - Auto-create SQLite DB on first run from data/ CSVs & JSONs
+ - View Tables (all datasets)
+ - Filter Data (multi-column filters)
+ - CRUD operations (create/read/update/delete)
+ - Credit/Debit simulation (with min balance enforcement)
+ - Analytical Insights (15 SQL queries)
+ - Intro & About pages
+
+Place your source files in ./data:
+ - customers.csv
+ - accounts.csv
+ - transactions.csv
+ - branches.json
+ - loans.json
+ - credit_cards.json
+ - support_tickets.json
+
+Run:
+    streamlit run app.py
+"""
+
+import streamlit as st
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import io
+import json
+import textwrap
+from pathlib import Path
+from sqlalchemy import create_engine, event, text, bindparam
+from sqlalchemy.sql.elements import TextClause
+import sqlite3
+import datetime
+import functools
+import inspect
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# ---------------------------
+# Paths & DB connection setup
+# ---------------------------
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+DB_PATH = BASE_DIR / "banksight.db"
+# column dtypes recorded at load time, restored by read_table_typed after SQL round trips
+DTYPES_PATH = DATA_DIR / "dtypes.json"
+
+# SQLite settings applied to every pooled connection: WAL lets readers run alongside a writer,
+# and a 64 MiB page cache keeps the hot tables in memory
+CONNECTION_PRAGMAS = ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL", "PRAGMA cache_size=-65536"]
+
+@st.cache_resource
+def get_engine():
+    # One engine (and connection pool) per process. st.cache_resource rather than functools.lru_cache:
+    # Streamlit re-executes this script on every rerun, which would start a fresh lru_cache each time.
+    # Use absolute path to avoid relative-path issues when running Streamlit
+    engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        for pragma in CONNECTION_PRAGMAS:
+            cur.execute(pragma)
+        cur.close()
+
+    return engine
+
+# ---------------------------
+# Utilities: JSON reader (handles JSON or JSON lines)
+# ---------------------------
+def read_json_file(path: Path) -> pd.DataFrame:
+    """Read JSON file. Supports standard JSON array or newline-delimited JSON (ndjson)."""
+    # pandas' C parser; keep values as written (no dtype/date coercion), like json.load
+    opts = dict(dtype=False, convert_dates=False, precise_float=True)
+    try:
+        try:
+            df = pd.read_json(path, orient="records", **opts)
+        except ValueError:
+            # try JSON lines
+            df = pd.read_json(path, lines=True, **opts)
+        # nested records still need flattening; any row may hold the first dict. Only object columns
+        # can hold one, so numeric columns are skipped (on pandas < 3 text columns are object too).
+        if any(df[c].map(type).eq(dict).any() for c in df.columns if df[c].dtype == object):
+            # keys a record did not have came back as NaN; drop them so json_normalize sees the
+            # records as written (a NaN under a nested key would add an extra all-null column)
+            records = [{k: v for k, v in r.items() if not (isinstance(v, float) and v != v)}
+                       for r in df.to_dict("records")]
+            df = pd.json_normalize(records)
+        return df
+    except ValueError:
+        pass
+    # last resort: parse line by line, skipping bad lines
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except Exception:
+                # skip bad line
+                continue
+    return pd.json_normalize(records)
+
+# ---------------------------
+# Auto-create DB if missing
+# ---------------------------
+# Generated columns for expressions the analytical queries group/filter on (Q6, Q7).
+# VIRTUAL: SQLite cannot ALTER TABLE ... ADD a STORED column; indexes on them are stored anyway.
+DERIVED_COLUMNS = {
+    "transactions": [
+        ("txn_month", "TEXT GENERATED ALWAYS AS (strftime('%Y-%m', txn_time)) VIRTUAL"),
+        ("txn_date", "TEXT GENERATED ALWAYS AS (DATE(txn_time)) VIRTUAL"),
+    ],
+    "customers": [("city_id", "INTEGER")],
+    "branches": [("city_id", "INTEGER")],
+}
+
+# Integer city key shared by customers and branches, so Q7/Q12/Q13 join on an int instead of text.
+# A city -> branch map cannot be unique: several branches share a city and the queries count each one.
+CITY_COLUMNS = {"customers": "city", "branches": "City"}
+# Lookup tables apply_schema maintains; not listed for viewing or editing
+INTERNAL_TABLES = ("cities",)
+CITY_KEY_STATEMENTS = ["CREATE TABLE IF NOT EXISTS cities (city_id INTEGER PRIMARY KEY, City TEXT UNIQUE)"] + [
+    f"INSERT OR IGNORE INTO cities(City) SELECT DISTINCT {col} FROM {table} WHERE {col} IS NOT NULL"
+    for table, col in CITY_COLUMNS.items()
+]
+
+def _city_key_backfill(table: str) -> str:
+    col = CITY_COLUMNS[table]
+    return f"UPDATE {table} SET city_id = (SELECT city_id FROM cities WHERE City = {table}.{col})"
+
+def _city_key_triggers(table: str) -> list:
+    """Keep city_id (and the cities table) current when rows are inserted or their city edited."""
+    col = CITY_COLUMNS[table]
+    body = (
+        f"INSERT OR IGNORE INTO cities(City) SELECT NEW.{col} WHERE NEW.{col} IS NOT NULL; "
+        f"UPDATE {table} SET city_id = (SELECT city_id FROM cities WHERE City = NEW.{col}) WHERE rowid = NEW.rowid;"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_city_{name} AFTER {trigger_on} ON {table} BEGIN {body} END"
+        for name, trigger_on in (("insert", "INSERT"), ("update", f"UPDATE OF {col}"))
+    ]
+
+# Indexes for the join / group-by keys used by the analytical queries (Q1..Q15)
+INDEX_STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_accounts_customer ON accounts(customer_id)",
+    # inner side of the CROSS JOINs in Q3 and Q7 (otherwise an automatic index is built per run)
+    "CREATE INDEX IF NOT EXISTS idx_customers_id ON customers(customer_id)",
+    "CREATE INDEX IF NOT EXISTS idx_txn_customer ON transactions(customer_id)",
+    "CREATE INDEX IF NOT EXISTS idx_customers_city ON customers(city)",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_priority_rating ON support_tickets(Priority, Customer_Rating)",
+    # covering indexes: Q3 reads the top balances, Q8 the amount range, Q10/Q11 the loans by customer
+    "CREATE INDEX IF NOT EXISTS idx_accounts_balance_cover ON accounts(account_balance DESC, customer_id)",
+    "CREATE INDEX IF NOT EXISTS idx_txn_amount_customer ON transactions(amount, customer_id)",
+    "CREATE INDEX IF NOT EXISTS idx_loans_cust_status_amt ON loans(Customer_ID, Loan_Status, Loan_Amount)",
+    # derived columns: Q6 groups by month, Q7 seeks its date window
+    "CREATE INDEX IF NOT EXISTS idx_txn_month ON transactions(txn_month, customer_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_txn_date ON transactions(txn_date)",
+    # integer city key: Q7, Q12, Q13
+    "CREATE INDEX IF NOT EXISTS idx_customers_city_id ON customers(city_id)",
+    "CREATE INDEX IF NOT EXISTS idx_branches_city_id ON branches(city_id)",
+]
+
+# Indexes earlier versions created that no query plan uses (or that a covering index above supersedes)
+RETIRED_INDEXES = [
+    "idx_customers_join", "idx_loans_status_cust_amt", "idx_loans_customer_status",
+    "idx_acc_customer",  # the original DB's duplicate of idx_accounts_customer
+    # Q6 filters on LOWER(status) through idx_txn_month; idx_txn_customer serves the customer_id seeks
+    "idx_txn_status_time", "idx_txn_customer_time",
+    "idx_branches_city",  # Q7/Q12/Q13 join branches on city_id; the city triggers look up cities
+]
+
+# Fresh-DB load settings: no journal I/O or fsync while the tables are written.
+# MEMORY (not OFF) keeps ROLLBACK TO working for per-file savepoints.
+BULK_LOAD_PRAGMAS = ["PRAGMA journal_mode=MEMORY", "PRAGMA synchronous=OFF", "PRAGMA temp_store=MEMORY"]
+RESTORE_PRAGMAS = ["PRAGMA journal_mode=DELETE", "PRAGMA synchronous=FULL", "PRAGMA temp_store=DEFAULT"]
+CSV_CHUNK_ROWS = 100_000
+
+def _sql_type(dtype) -> str:
+    """Column type for a pandas dtype, matching what df.to_sql declared."""
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "BIGINT"
+    if pd.api.types.is_float_dtype(dtype):
+        return "FLOAT"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "TIMESTAMP"
+    return "TEXT"
+
+def bulk_insert(conn: sqlite3.Connection, table: str, frames) -> None:
+    """(Re)create `table` from the first frame's dtypes and executemany every frame into it."""
+    insert = None
+    for df in frames:
+        # Basic cleaning: ensure columns lowercase / consistent
+        df.columns = [c.strip() for c in df.columns]
+        if insert is None:
+            cols = ", ".join(f'"{c}" {_sql_type(t)}' for c, t in df.dtypes.items())
+            conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+            conn.execute(f'CREATE TABLE "{table}" ({cols})')
+            insert = f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(df.columns))})'
+        conn.executemany(insert, df.itertuples(index=False, name=None))
+
+def _exec(conn, sql: str):
+    """Run one statement on either a SQLAlchemy connection or a raw sqlite3 connection."""
+    if isinstance(conn, sqlite3.Connection):
+        return conn.execute(sql)
+    return conn.execute(text(sql))
+
+def derived_column_names(table: str) -> set:
+    return {name for name, _ in DERIVED_COLUMNS.get(table, [])}
+
+def source_columns(conn, table: str) -> list[str]:
+    """`table`'s own columns, without the ones apply_schema adds (SELECT * would return them)."""
+    derived = derived_column_names(table)
+    return [r[1] for r in _exec(conn, f'PRAGMA table_info("{table}")') if r[1] not in derived]
+
+def select_source(conn, table: str) -> str:
+    """SELECT of `table`'s own columns, so every read path shows the same column set."""
+    cols = ", ".join(f'"{c}"' for c in source_columns(conn, table))
+    return f'SELECT {cols} FROM "{table}"'
+
+def parquet_path(table_name: str) -> Path:
+    return DATA_DIR / f"{table_name}.parquet"
+
+def export_parquet(conn: sqlite3.Connection, table: str) -> dict:
+    """Snapshot a freshly loaded table to data/<table>.parquet (typed, zstd) for the read-only pages.
+
+    Returns the snapshot's {column: dtype} so the same types can be restored on SQLite reads.
+    """
+    df = infer_column_types(pd.read_sql_query(select_source(conn, table), conn))
+    df.to_parquet(parquet_path(table), compression="zstd", index=False)
+    return {c: str(t) for c, t in df.dtypes.items()}
+
+def apply_schema(conn) -> bool:
+    """Add any missing derived columns and indexes (idempotent). Returns True if the schema changed.
+
+    Works on a SQLAlchemy connection or the raw sqlite3 one used for the initial bulk load.
+    """
+    before = _exec(conn, "PRAGMA schema_version").fetchone()[0]
+    for stmt in CITY_KEY_STATEMENTS:
+        try:
+            _exec(conn, stmt)
+        except Exception:
+            pass
+    for table, columns in DERIVED_COLUMNS.items():
+        existing = {r[1] for r in _exec(conn, f"PRAGMA table_xinfo({table})")}
+        for name, ddl in columns:
+            if existing and name not in existing:
+                try:
+                    _exec(conn, f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+                    if name == "city_id":
+                        _exec(conn, _city_key_backfill(table))
+                except Exception:
+                    pass
+        if existing and table in CITY_COLUMNS:
+            for stmt in _city_key_triggers(table):
+                try:
+                    _exec(conn, stmt)
+                except Exception:
+                    pass
+    for name in RETIRED_INDEXES:
+        _exec(conn, f"DROP INDEX IF EXISTS {name}")
+    # optional, will not fail if columns missing
+    for stmt in INDEX_STATEMENTS:
+        try:
+            _exec(conn, stmt)
+        except Exception:
+            pass
+    return _exec(conn, "PRAGMA schema_version").fetchone()[0] != before
+
+def create_database_from_data():
+    """Create banksight.db from CSV and JSON files in data/ if DB does not exist."""
+    if DB_PATH.exists():
+        return False  # DB already exists -> nothing to do
+
+    # Make sure data dir exists
+    if not DATA_DIR.exists():
+        st.warning(f"Data folder not found at {DATA_DIR}. Place your CSV/JSON files there.")
+        return False
+
+    # Expected files and table mapping
+    csv_files = {
+        "customers.csv": "customers",
+        "accounts.csv": "accounts",
+        "transactions.csv": "transactions",
+    }
+    json_files = {
+        "branches.json": "branches",
+        "loans.json": "loans",
+        "credit_cards.json": "credit_cards",
+        "support_tickets.json": "support_tickets",
+    }
+
+    # Load all files in one transaction; a savepoint per file keeps one bad file from sinking the rest
+    dtype_hints = {}
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    try:
+        for pragma in BULK_LOAD_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("BEGIN")
+        for fname, table in {**csv_files, **json_files}.items():
+            # a snapshot left by an earlier build would be served instead of this build's rows
+            parquet_path(table).unlink(missing_ok=True)
+            p = DATA_DIR / fname
+            if not p.exists():
+                st.warning(f"{fname} not found in data/ — {table} table will not be created.")
+                continue
+            conn.execute("SAVEPOINT load_file")
+            try:
+                if fname in csv_files:
+                    # stream large CSVs instead of materializing them whole; closing releases the file handle
+                    with pd.read_csv(p, chunksize=CSV_CHUNK_ROWS) as frames:
+                        bulk_insert(conn, table, frames)
+                else:
+                    bulk_insert(conn, table, [read_json_file(p)])
+                conn.execute("RELEASE load_file")
+            except Exception as e:
+                conn.execute("ROLLBACK TO load_file")
+                conn.execute("RELEASE load_file")
+                st.error(f"Failed to load {fname}: {e}")
+                continue
+            try:
+                dtype_hints[table] = export_parquet(conn, table)
+            except Exception as e:
+                parquet_path(table).unlink(missing_ok=True)  # drop a partially written file
+                st.warning(f"Parquet snapshot of {table} not written: {e}")
+        # derived columns, indexes and planner statistics go in the same transaction: one commit, no fsync
+        apply_schema(conn)
+        conn.execute("ANALYZE")
+        conn.execute("COMMIT")
+    finally:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        for pragma in RESTORE_PRAGMAS:
+            conn.execute(pragma)
+        conn.close()
+    DTYPES_PATH.write_text(json.dumps(dtype_hints, indent=2), encoding="utf-8")
+
+    st.success(f"Database created at {DB_PATH}")
+    return True
+
+@st.cache_resource
+def upgrade_database():
+    """Bring an existing DB up to the current derived columns / indexes (once per process)."""
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("BEGIN")
+        if apply_schema(conn):
+            conn.execute(text("ANALYZE"))
+
+# ---------------------------
+# Cached DB reads (do NOT pass engine as a parameter)
+# ---------------------------
+# Bound on entries per table in each table-scoped cache (limits / filter combinations)
+TABLE_CACHE_MAX_ENTRIES = 64
+
+@st.cache_resource
+def table_versions() -> dict:
+    """Write counter per table, shared by all sessions. Part of every table-scoped cache key."""
+    return {}
+
+# Every per_table tracked_cache, so invalidate(table) can evict that table's entries from each
+TABLE_CACHES = []
+
+def _count_cache(name: str, field: str):
+    stats = st.session_state.setdefault("cache_stats", {})
+    stats.setdefault(name, {"calls": 0, "misses": 0})[field] += 1
+
+def tracked_cache(per_table: bool = False, **cache_kwargs):
+    """st.cache_data that also counts calls and misses in st.session_state["cache_stats"].
+
+    With per_table=True the first argument is a table name and each table gets its own cache
+    (a dict of caches keyed by table), so .clear(table) frees just that table's frames. The
+    table's write version is part of the key too: a read still running during a write cannot
+    put a stale frame back under the new version.
+    """
+    def decorator(func):
+        name = func.__name__
+
+        def make_cache(suffix: str = ""):
+            def compute(version, *args, **kwargs):
+                _count_cache(name, "misses")
+                return func(*args, **kwargs)
+            # st.cache_data keys on the function's qualified name, so a suffix gives a separate cache
+            compute.__module__, compute.__qualname__ = func.__module__, func.__qualname__ + suffix
+            return st.cache_data(**cache_kwargs)(compute)
+
+        caches = {}
+        signature = inspect.signature(func)
+
+        def cache_for(table: str):
+            if table not in caches:
+                caches[table] = make_cache(f"[{table}]") if per_table else make_cache()
+            return caches[table]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            _count_cache(name, "calls")
+            # one canonical form, so f(t, 1000), f(t, limit=1000) and f(t) share a cache key
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            args, kwargs = bound.args, bound.kwargs
+            if not per_table:
+                return cache_for("")(0, *args, **kwargs)
+            return cache_for(args[0])(table_versions().get(args[0], 0), *args, **kwargs)
+
+        def clear(table: str | None = None):
+            cache_for(table if per_table else "").clear()
+
+        wrapper.clear = clear
+        if per_table:
+            TABLE_CACHES.append(wrapper)
+        return wrapper
+    return decorator
+
+@tracked_cache(show_spinner=False, ttl=600)
+def list_tables() -> list[str]:
+    """Names of the user tables in the DB (cached; the schema only changes on DB creation)."""
+    engine = get_engine()
+    with engine.connect() as conn:
+        res = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"))
+        return [r[0] for r in res.fetchall() if r[0] not in INTERNAL_TABLES]
+
+@tracked_cache(show_spinner=False)
+def get_schema(table_name: str) -> pd.DataFrame:
+    """PRAGMA table_info for a table's own columns (cached), used by the schema-driven CRUD forms."""
+    # PRAGMA arguments can't be bound, so only interpolate names that exist in the DB
+    if table_name not in list_tables():
+        return pd.DataFrame()
+    engine = get_engine()
+    try:
+        df = pd.read_sql_query(text(f"PRAGMA table_info({table_name})"), engine)
+    except Exception:
+        return pd.DataFrame()
+    return df[~df["name"].isin(derived_column_names(table_name))].reset_index(drop=True)
+
+@tracked_cache(per_table=True, show_spinner=False, max_entries=TABLE_CACHE_MAX_ENTRIES)
+def read_table(table_name: str, limit: int = 1000) -> pd.DataFrame:
+    """Read a table from the DB (cached). Do not pass 'engine' to avoid hashing issues."""
+    engine = get_engine()
+    try:
+        with engine.connect() as conn:
+            df = pd.read_sql_query(text(f"{select_source(conn, table_name)} LIMIT {limit}"), conn)
+    except Exception:
+        # Return empty DF if table missing
+        df = pd.DataFrame()
+    return df
+
+# Text columns with fewer distinct values than this share of rows are stored as category
+CATEGORY_MAX_RATIO = 0.5
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Store integer columns in the smallest int dtype that holds them.
+
+    Floats stay float64: float32 would turn e.g. 12.43 into 12.430000305 in views and exports.
+    """
+    for col in df.columns:
+        if pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+def infer_column_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numbers, parse date/time text columns and store low-cardinality text as category."""
+    df = downcast_numeric(df)
+    for col in df.columns:
+        s = df[col]
+        # only pure-text columns; mixed values (e.g. text typed into a numeric column) are left alone
+        if pd.api.types.infer_dtype(s, skipna=True) != "string":
+            continue
+        if "date" in col.lower() or "time" in col.lower():
+            parsed = pd.to_datetime(s, errors="coerce", format="ISO8601", cache=True)
+            # keep the raw text if any value is not ISO formatted (e.g. dd-mm-yyyy)
+            if parsed.notna().sum() == s.notna().sum():
+                df[col] = parsed
+                continue
+        if len(s) and s.nunique() / len(s) < CATEGORY_MAX_RATIO:
+            df[col] = s.astype("category")
+    return df
+
+@tracked_cache(show_spinner=False)
+def load_dtype_hints() -> dict:
+    """{table: {column: dtype}} recorded when the DB was built from data/ (cached). Empty if absent."""
+    try:
+        return json.loads(DTYPES_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def apply_dtype_hints(df: pd.DataFrame, hints: dict) -> pd.DataFrame:
+    """Restore recorded category/datetime columns, skipping any whose values no longer fit."""
+    df = downcast_numeric(df)
+    for col, dtype in hints.items():
+        if col not in df.columns or pd.api.types.infer_dtype(df[col], skipna=True) != "string":
+            continue
+        s = df[col]
+        if dtype == "category":
+            df[col] = s.astype("category")
+        elif dtype.startswith("datetime64"):
+            parsed = pd.to_datetime(s, errors="coerce", format="ISO8601", cache=True)
+            if parsed.notna().sum() == s.notna().sum():
+                df[col] = parsed
+    return df
+
+@tracked_cache(per_table=True, show_spinner=False, max_entries=TABLE_CACHE_MAX_ENTRIES)
+def read_table_typed(table_name: str, limit: int = 1000) -> pd.DataFrame:
+    """read_table with dtypes restored from data/dtypes.json, or inferred if none were recorded (cached)."""
+    df = read_table(table_name, limit)
+    hints = load_dtype_hints().get(table_name)
+    return apply_dtype_hints(df, hints) if hints else infer_column_types(df)
+
+@tracked_cache(per_table=True, show_spinner=False, max_entries=TABLE_CACHE_MAX_ENTRIES)
+def read_parquet_table(table_name: str, limit: int = 1000) -> pd.DataFrame:
+    """Read a table's Parquet snapshot without touching SQLite (cached). Empty if there is none."""
+    path = parquet_path(table_name)
+    if not path.exists():
+        return pd.DataFrame()
+    try:
+        # decode only the leading batches that hold `limit` rows, not the whole file
+        pf = pq.ParquetFile(path)
+        batches, rows = [], 0
+        for batch in pf.iter_batches(batch_size=limit):
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= limit:
+                break
+        return pa.Table.from_batches(batches, schema=pf.schema_arrow).to_pandas().head(limit)
+    except Exception:
+        return pd.DataFrame()
+
+def view_table(table_name: str, limit: int = 1000) -> pd.DataFrame:
+    """Table for the read-only pages: the Parquet snapshot while it is current, else SQLite."""
+    df = read_parquet_table(table_name, limit)
+    return df if not df.empty else read_table_typed(table_name, limit)
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize straight into a bytes buffer instead of building a str and encoding it."""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
+
+@tracked_cache(per_table=True, show_spinner=False, max_entries=TABLE_CACHE_MAX_ENTRIES)
+def table_csv_bytes(table_name: str, limit: int = 1000) -> bytes:
+    """CSV export of the stored values (cached) so reruns don't re-serialize it.
+
+    Built from the untyped read_table: parsed datetimes would be re-formatted on the way out.
+    """
+    return to_csv_bytes(read_table(table_name, limit))
+
+# Offer a (much smaller) Parquet download next to CSV from this many rows on
+PARQUET_DOWNLOAD_MIN_ROWS = 10_000
+
+@tracked_cache(per_table=True, show_spinner=False, max_entries=TABLE_CACHE_MAX_ENTRIES)
+def table_parquet_bytes(table_name: str, limit: int = 1000) -> bytes:
+    """zstd Parquet export of view_table(table_name, limit) (cached)."""
+    buf = io.BytesIO()
+    view_table(table_name, limit).to_parquet(buf, compression="zstd", index=False)
+    return buf.getvalue()
+
+@tracked_cache(per_table=True, show_spinner=False, max_entries=TABLE_CACHE_MAX_ENTRIES)
+def get_column_stats(table_name: str) -> dict:
+    """Classify a table's columns for the Filter Data widgets (cached).
+
+    Returns {column: (kind, min, max)} where kind is "numeric", "date" or "category".
+    Bounds come from one MIN/MAX query in SQLite, so no rows are loaded into pandas.
+    """
+    schema_df = get_schema(table_name)
+    if schema_df.empty:
+        return {}
+    kinds = {}
+    for name, decl_type in zip(schema_df["name"], schema_df["type"].fillna("").str.upper()):
+        if any(a in decl_type for a in ("INT", "REAL", "FLOA", "DOUB", "NUM", "DEC")):
+            kinds[name] = "numeric"
+        elif "date" in name.lower() or "time" in name.lower():
+            kinds[name] = "date"
+        else:
+            kinds[name] = "category"
+    ranged = [c for c, k in kinds.items() if k != "category"]
+    bounds = []
+    if ranged:
+        aggs = ", ".join(
+            f'MIN("{c}"), MAX("{c}")' if kinds[c] == "numeric" else f'MIN(DATE("{c}")), MAX(DATE("{c}"))'
+            for c in ranged
+        )
+        engine = get_engine()
+        try:
+            with engine.connect() as conn:
+                bounds = conn.execute(text(f'SELECT {aggs} FROM "{table_name}"')).fetchone()
+        except Exception:
+            return {}
+
+    stats = {c: ("category", None, None) for c in kinds}
+    for i, col in enumerate(ranged):
+        lo, hi = bounds[2 * i], bounds[2 * i + 1]
+        try:
+            if kinds[col] == "numeric":
+                stats[col] = ("numeric", float(lo) if lo is not None else 0.0, float(hi) if hi is not None else 0.0)
+            elif lo is not None:
+                stats[col] = ("date", datetime.date.fromisoformat(lo), datetime.date.fromisoformat(hi))
+        except (TypeError, ValueError):
+            # non-numeric values stored in a numeric column: filter it by value instead
+            pass
+    return stats
+
+@tracked_cache(per_table=True, show_spinner=False, max_entries=TABLE_CACHE_MAX_ENTRIES)
+def get_distinct_values(table_name: str, column: str, limit: int = 200) -> list:
+    """Distinct non-null values of a column in first-seen order, for the categorical multiselects (cached)."""
+    engine = get_engine()
+    query = (f'SELECT "{column}" FROM "{table_name}" WHERE "{column}" IS NOT NULL '
+             f'GROUP BY "{column}" ORDER BY MIN(rowid) LIMIT :n')
+    try:
+        with engine.connect() as conn:
+            return [r[0] for r in conn.execute(text(query), {"n": limit})]
+    except Exception:
+        return []
+
+@tracked_cache(per_table=True, show_spinner=False, max_entries=TABLE_CACHE_MAX_ENTRIES)
+def read_filtered(table_name: str, columns: tuple, where: str, params: dict, limit: int = 50000) -> pd.DataFrame:
+    """Run a filtered SELECT in SQLite (cached). List-valued params are bound as IN (...) lists."""
+    engine = get_engine()
+    select_list = ", ".join(f'"{c}"' for c in columns)
+    stmt = text(f'SELECT {select_list} FROM "{table_name}" WHERE {where} LIMIT :n')
+    stmt = stmt.bindparams(*[bindparam(k, expanding=True) for k, v in params.items() if isinstance(v, list)])
+    try:
+        return pd.read_sql_query(stmt, engine, params={**params, "n": limit})
+    except Exception:
+        return pd.DataFrame()
+
+@tracked_cache(show_spinner=False, max_entries=32, hash_funcs={TextClause: str})
+def read_sql_query(query: TextClause | str, params: dict | None = None) -> pd.DataFrame:
+    """Run a read-only query (cached on the SQL text and its bind params)."""
+    if not isinstance(query, TextClause):
+        query = text(query)
+    try:
+        return pd.read_sql_query(query, get_engine(), params=params)
+    except Exception:
+        return pd.DataFrame()
+
+def invalidate(table: str):
+    """Retire cached reads of `table` after a write, and drop its now stale Parquet snapshot.
+
+    Other tables keep their entries. Free-form queries may join any table, so they are cleared.
+    """
+    parquet_path(table).unlink(missing_ok=True)
+    versions = table_versions()
+    versions[table] = versions.get(table, 0) + 1
+    # free the now unreachable frames instead of waiting for max_entries to evict them
+    for cached in TABLE_CACHES:
+        cached.clear(table)
+    read_sql_query.clear()
+
+# ---------------------------
+# CRUD helpers
+# ---------------------------
+def insert_record(table: str, record: dict):
+    engine = get_engine()
+    cols = ", ".join(record.keys())
+    vals = ", ".join([f":{k}" for k in record.keys()])
+    stmt = text(f"INSERT INTO {table} ({cols}) VALUES ({vals})")
+    with engine.begin() as conn:
+        conn.execute(stmt, record)
+    # clear cache
+    invalidate(table)
+
+def update_records(table: str, pk_col: str, rows: list):
+    """Write edited cells back (dicts of changed column -> value, plus pk_col) in one transaction.
+
+    Rows are grouped by the set of columns they change, one executemany UPDATE per group, so cells
+    the user did not touch are left as stored.
+    """
+    groups = {}
+    for r in rows:
+        set_cols = tuple(k for k in r if k != pk_col)
+        if set_cols:
+            groups.setdefault(set_cols, []).append({**{k: r[k] for k in set_cols}, "pk_val": r[pk_col]})
+    if not groups:
+        return
+    engine = get_engine()
+    with engine.begin() as conn:
+        for set_cols, params in groups.items():
+            set_clause = ", ".join([f"{k} = :{k}" for k in set_cols])
+            conn.execute(text(f"UPDATE {table} SET {set_clause} WHERE {pk_col} = :pk_val"), params)
+    invalidate(table)
+
+def delete_records(table: str, pk_col: str, pk_vals: list):
+    if not pk_vals:
+        return
+    engine = get_engine()
+    stmt = text(f"DELETE FROM {table} WHERE {pk_col} = :v")
+    with engine.begin() as conn:
+        conn.execute(stmt, [{"v": v} for v in pk_vals])
+    invalidate(table)
+
+def editor_records(df: pd.DataFrame) -> list:
+    """Rows as plain Python values (None for missing) so sqlite3 can bind them."""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+def changed_cells(before: pd.DataFrame, after: pd.DataFrame, pk_col: str, columns: list) -> list:
+    """One dict per edited row: pk_col plus only the columns whose value changed."""
+    diff = before[columns].compare(after[columns])
+    if diff.empty:
+        return []
+    # compare() leaves both sides NaN where a cell is unchanged
+    changed = diff.xs("self", axis=1, level=1).notna() | diff.xs("other", axis=1, level=1).notna()
+    # new values come from the edited frame: compare() turns int columns into float
+    new_values = editor_records(after.loc[diff.index, list(changed.columns) + [pk_col]])
+    return [
+        {**{c: vals[c] for c in changed.columns if flags[c]}, pk_col: vals[pk_col]}
+        for vals, flags in zip(new_values, changed.to_dict("records"))
+    ]
+
+# ---------------------------
+# Analytical SQL queries (Q1..Q15)
+# ---------------------------
+SQL_QUERIES = {
+    "Q1: Customers per city & avg balance":
+        """
+        SELECT c.city,
+               COUNT(*) AS total_customers,
+               ROUND(AVG(a.account_balance),2) AS avg_balance
+        FROM customers c
+        JOIN accounts a ON c.customer_id = a.customer_id
+        GROUP BY c.city
+        ORDER BY avg_balance DESC;
+        """,
+
+    "Q2: Account type holding highest total balance":
+        """
+        SELECT c.account_type,
+               SUM(a.account_balance) AS total_balance
+        FROM customers c
+        JOIN accounts a ON c.customer_id = a.customer_id
+        GROUP BY c.account_type
+        ORDER BY total_balance DESC;
+        """,
+
+    # CROSS JOIN keeps accounts as the outer loop, so the top 10 are read off idx_accounts_balance_cover
+    "Q3: Top 10 customers by total balance":
+        """
+        SELECT c.customer_id, c.name, c.city, a.account_balance
+        FROM accounts a
+        CROSS JOIN customers c ON c.customer_id = a.customer_id
+        ORDER BY a.account_balance DESC
+        LIMIT 10;
+        """,
+
+    "Q4: Customers in 2023 with balance > 100000":
+        """
+        SELECT c.customer_id, c.name, c.city, c.join_date, a.account_balance
+        FROM customers c
+        JOIN accounts a ON c.customer_id = a.customer_id
+        WHERE c.join_date LIKE '2023%' AND a.account_balance > 100000;
+        """,
+
+    "Q5: Total transaction volume by type":
+        """
+        SELECT txn_type, SUM(amount) AS total_volume
+        FROM transactions
+        GROUP BY txn_type
+        ORDER BY total_volume DESC;
+        """,
+
+    "Q6: Accounts with >3 failed txns in a month":
+        """
+        SELECT customer_id, txn_month AS month, COUNT(*) AS failed_count
+        FROM transactions
+        WHERE LOWER(status) = 'failed'
+        GROUP BY customer_id, txn_month
+        HAVING COUNT(*) > 3;
+        """,
+
+    # CROSS JOIN keeps transactions as the outer loop, so only the window's rows are read (idx_txn_date)
+    "Q7: Top 5 branches by txn volume (last 6 months)":
+        """
+        SELECT b.Branch_Name, SUM(t.amount) AS total_volume
+        FROM transactions t
+        CROSS JOIN customers c ON t.customer_id = c.customer_id
+        JOIN branches b ON c.city_id = b.city_id
+        WHERE t.txn_date >= DATE('now','-6 months')
+        GROUP BY b.Branch_Name
+        ORDER BY total_volume DESC
+        LIMIT 5;
+        """,
+
+    # +customer_id: group after the amount range seek instead of scanning idx_txn_customer in key order
+    "Q8: Accounts with >=5 high-value txns (>200000)":
+        """
+        SELECT customer_id, COUNT(*) AS high_value_count
+        FROM transactions
+        WHERE amount > 200000
+        GROUP BY +customer_id
+        HAVING COUNT(*) >= 5;
+        """,
+
+    "Q9: Avg loan amount & interest by loan type":
+        """
+        SELECT Loan_Type, AVG(Loan_Amount) AS avg_amount, AVG(Interest_Rate) AS avg_rate
+        FROM loans
+        GROUP BY Loan_Type;
+        """,
+
+    "Q10: Customers holding >1 active/approved loan":
+        """
+        SELECT Customer_ID, COUNT(*) AS active_loans
+        FROM loans
+        WHERE Loan_Status IN ('Active', 'Approved')
+        GROUP BY Customer_ID
+        HAVING COUNT(*) > 1;
+        """,
+
+    "Q11: Top 5 customers with highest outstanding loan amount":
+        """
+        SELECT Customer_ID, SUM(Loan_Amount) AS total_outstanding
+        FROM loans
+        WHERE Loan_Status != 'Closed'
+        GROUP BY Customer_ID
+        ORDER BY total_outstanding DESC
+        LIMIT 5;
+        """,
+
+    "Q12: Branch with highest total account balance":
+        """
+        SELECT b.Branch_Name, SUM(a.account_balance) AS total_balance
+        FROM accounts a
+        JOIN customers c ON a.customer_id = c.customer_id
+        JOIN branches b ON c.city_id = b.city_id
+        GROUP BY b.Branch_Name
+        ORDER BY total_balance DESC
+        LIMIT 1;
+        """,
+
+    "Q13: Branch performance summary":
+        """
+        SELECT b.Branch_Name,
+               COUNT(DISTINCT c.customer_id) AS total_customers,
+               COUNT(DISTINCT l.Loan_ID) AS total_loans,
+               COALESCE(SUM(t.amount),0) AS transaction_volume
+        FROM branches b
+        LEFT JOIN customers c ON c.city_id = b.city_id
+        LEFT JOIN loans l ON l.Branch = b.Branch_Name OR l.Branch = b.City
+        LEFT JOIN transactions t ON t.customer_id = c.customer_id
+        GROUP BY b.Branch_Name;
+        """,
+
+    "Q14: Issue categories with longest avg resolution time":
+        """
+        SELECT Issue_Category,
+               AVG(julianday(Date_Closed) - julianday(Date_Opened)) AS avg_days
+        FROM support_tickets
+        WHERE Date_Closed IS NOT NULL
+        GROUP BY Issue_Category
+        ORDER BY avg_days DESC;
+        """,
+
+    "Q15: Support agents resolving most critical tickets (rating >=4)":
+        """
+        SELECT Support_Agent, COUNT(*) AS resolved_critical
+        FROM support_tickets
+        WHERE Priority = 'Critical' AND Customer_Rating >= 4
+        GROUP BY Support_Agent
+        ORDER BY resolved_critical DESC;
+        """
+}
+# Dedent and compile each query once at import instead of on every cache miss
+SQL_QUERIES = {name: text(textwrap.dedent(q).strip()) for name, q in SQL_QUERIES.items()}
+
+@st.cache_resource
+def insight_executor() -> ThreadPoolExecutor:
+    """Worker pool for prefetching the analytical queries (shared by all sessions)."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="insights")
+
+@st.cache_resource
+def insight_results() -> dict:
+    """{(insight name, data version): Future} shared by all sessions."""
+    return {}
+
+def prefetch_insights() -> dict[str, Future]:
+    """Start the SQL_QUERIES not yet computed (or running) for the current data version.
+
+    Results are shared across sessions, so each query runs once per write. WAL mode lets the
+    workers read concurrently; the selected insight waits only on its own result.
+    Failed queries are not kept: they are resubmitted on the next rerun.
+    """
+    version = sum(table_versions().values())
+    store = insight_results()
+    for key, fut in list(store.items()):
+        if key[1] != version or (fut.done() and fut.exception() is not None):
+            store.pop(key, None)
+    engine = get_engine()
+    executor = insight_executor()
+    futures = {}
+    for name, q in SQL_QUERIES.items():
+        fut = store.get((name, version))
+        if fut is None:
+            # plain pd.read_sql_query: errors must fail the future instead of caching an empty frame
+            fut = store.setdefault((name, version), executor.submit(pd.read_sql_query, q, engine))
+        futures[name] = fut
+    return futures
+
+# ---------------------------
+# Streamlit UI
+# ---------------------------
+st.set_page_config(page_title="BankSight", layout="wide")
+st.title("🏦 BankSight: Transaction Intelligence Dashboard")
+
+# Auto-create DB if missing (runs once)
+if not DB_PATH.exists():
+    with st.spinner("Creating SQLite database from data/ — this runs only on first start..."):
+        created = create_database_from_data()
+        if not created:
+            st.warning("Database was not created. Fix data in data/ folder and refresh.")
+else:
+    upgrade_database()
+    # show small note
+    st.info("Using existing database at " + str(DB_PATH))
+
+# Sidebar navigation (multipage)
+page = st.sidebar.radio("Navigation", [
+    "🏠 Introduction",
+    "📊 View Tables",
+    "🔍 Filter Data",
+    "✏️ CRUD Operations",
+    "💰 Credit / Debit Simulation",
+    "🧠 Analytical Insights",
+    "👩‍💻 About Creator"
+])
+
+# filled in at the end of the script, once this rerun's cached reads have been counted
+cache_diagnostics = st.sidebar.empty()
+
+# ---------------------------
+# Page: Introduction
+# ---------------------------
+if page == "🏠 Introduction":
+    st.header("BankSight — Transaction Intelligence Dashboard")
+    st.markdown("""
+    **Purpose:** Explore customers, accounts, transactions, loans, credit cards, branches, and support tickets.
+    This dashboard reads from a local SQLite database (created from files in `data/`).
+    """)
+    st.markdown("**Datasets included:** customers, accounts, transactions, branches, loans, credit_cards, support_tickets.")
+    st.markdown("Use the left sidebar to navigate between pages.")
+
+# ---------------------------
+# Page: View Tables
+# ---------------------------
+elif page == "📊 View Tables":
+    st.header("📊 View Tables")
+    # check what tables exist
+    tables_available = list_tables()
+    st.write("Available tables:", tables_available)
+
+    selected = st.selectbox("Select table to view", options=tables_available if tables_available else ["customers", "accounts", "transactions"])
+    limit = st.number_input("Rows to load", min_value=50, max_value=200000, value=1000, step=50)
+    df = view_table(selected, limit=int(limit))
+    if df.empty:
+        st.warning("No data found in table: " + selected)
+    else:
+        st.dataframe(df)
+        st.download_button("⬇️ Download CSV", table_csv_bytes(selected, limit=int(limit)), f"{selected}.csv", "text/csv")
+        if len(df) >= PARQUET_DOWNLOAD_MIN_ROWS:
+            st.download_button("⬇️ Download Parquet", table_parquet_bytes(selected, limit=int(limit)),
+                               f"{selected}.parquet", "application/vnd.apache.parquet")
+
+# ---------------------------
+# Page: Filter Data
+# ---------------------------
+elif page == "🔍 Filter Data":
+    st.header("🔍 Filter Data (multi-column filters)")
+    # let user choose a table
+    table = st.selectbox("Choose dataset", list_tables())
+    # column kinds and min/max come from SQLite; rows are only fetched once filtered
+    stats = get_column_stats(table)
+    if not stats:
+        st.warning("No data to filter for table: " + table)
+    else:
+        columns = list(stats.keys())
+        st.write("Columns:", columns)
+        # choose columns to show
+        show_cols = st.multiselect("Columns to show", options=columns, default=columns[:6])
+        # build WHERE clause fragments and bind params
+        clauses = []
+        params = {}
+        for i, col in enumerate(show_cols):
+            kind, lo, hi = stats[col]
+            if kind == "numeric":
+                r = st.slider(f"{col} range", lo, hi, (lo, hi))
+                clauses.append(f'"{col}" BETWEEN :lo_{i} AND :hi_{i}')
+                params[f"lo_{i}"], params[f"hi_{i}"] = r
+            elif kind == "date":
+                start = st.date_input(f"{col} start", value=lo)
+                end = st.date_input(f"{col} end", value=hi)
+                clauses.append(f'DATE("{col}") BETWEEN :start_{i} AND :end_{i}')
+                params[f"start_{i}"], params[f"end_{i}"] = start.isoformat(), end.isoformat()
+            else:
+                vals = get_distinct_values(table, col)
+                sel = st.multiselect(f"{col} values", options=vals, default=vals[:5] if vals else [])
+                if sel:
+                    clauses.append(f'"{col}" IN :vals_{i}')
+                    params[f"vals_{i}"] = sel
+        if not show_cols:
+            st.info("Select at least one column to show.")
+        else:
+            result = read_filtered(table, tuple(show_cols), " AND ".join(clauses) or "1=1", params)
+            st.write(f"Filtered rows: {len(result)}")
+            st.dataframe(result)
+
+# ---------------------------
+# Page: CRUD Operations
+# ---------------------------
+elif page == "✏️ CRUD Operations":
+    st.header("✏️ CRUD Operations")
+    table = st.selectbox("Choose table for CRUD", options=list_tables())
+    mode = st.radio("Operation", ["Create", "Read", "Update", "Delete"])
+    schema_df = get_schema(table)
+    cols = [row['name'] for _, row in schema_df.iterrows()] if not schema_df.empty else []
+    # Attempt to find a primary key column (heuristic)
+    pk_col = None
+    if not schema_df.empty:
+        for _, row in schema_df.iterrows():
+            if row.get('pk') == 1 or row.get('pk') == '1' or 'id' in row['name'].lower():
+                pk_col = row['name']
+                break
+    if not pk_col and cols:
+        pk_col = cols[0]  # fallback
+
+    if mode == "Create":
+        st.subheader("Create new record")
+        new = {}
+        for c in cols:
+            new[c] = st.text_input(c, key=f"create_{c}")
+        if st.button("Insert record"):
+            # remove empty keys if primary autoinc should be skipped
+            payload = {k: v for k, v in new.items() if v != ""}
+            try:
+                insert_record(table, payload)
+                st.success("Inserted record.")
+            except Exception as e:
+                st.error("Insert failed: " + str(e))
+
+    elif mode == "Read":
+        st.subheader("Read / Browse")
+        limit = st.number_input("Rows", 10, 10000, 500)
+        df = read_table(table, limit=int(limit))
+        st.dataframe(df)
+
+    elif mode == "Update":
+        st.subheader("Edit records in place")
+        st.write("Primary key column used:", pk_col)
+        limit = st.number_input("Rows", 10, 10000, 500, key="upd_rows")
+        df = read_table(table, limit=int(limit))
+        df = df[[c for c in cols if c in df.columns]]
+        # the key stays read-only; it identifies the row to update
+        locked = [c for c in df.columns if c == pk_col]
+        edited = st.data_editor(df, key=f"editor_{table}", disabled=locked, hide_index=True)
+        if st.button("Execute update"):
+            editable = [c for c in df.columns if c not in locked]
+            rows = changed_cells(df, edited, pk_col, editable)
+            try:
+                update_records(table, pk_col, rows)
+                st.success(f"Updated {len(rows)} row(s).")
+            except Exception as e:
+                st.error("Update failed: " + str(e))
+
+    elif mode == "Delete":
+        st.subheader("Delete records")
+        st.write("Primary key column used:", pk_col)
+        st.caption("Select rows and delete them in the grid, then apply.")
+        limit = st.number_input("Rows", 10, 10000, 500, key="del_rows")
+        df = read_table(table, limit=int(limit))
+        df = df[[c for c in cols if c in df.columns]]
+        # cells stay read-only; disabled=True would also block row deletion in the grid
+        remaining = st.data_editor(df, key=f"delete_{table}", num_rows="delete", disabled=list(df.columns),
+                                   hide_index=True)
+        if st.button("Delete"):
+            kept = set(remaining[pk_col].dropna())
+            removed = [v for v in df[pk_col].dropna().unique().tolist() if v not in kept]
+            try:
+                delete_records(table, pk_col, removed)
+                st.success(f"Deleted {len(removed)} row(s).")
+            except Exception as e:
+                st.error("Delete failed: " + str(e))
+
+# ---------------------------
+# Page: Credit / Debit Simulation
+# ---------------------------
+elif page == "💰 Credit / Debit Simulation":
+    st.header("💰 Credit / Debit Simulation")
+    st.markdown("Enter a `customer_id` to load the account balance, then deposit or withdraw (simulation updates DB).")
+
+    cid = st.text_input("Customer ID")
+    if st.button("Load balance"):
+        df_acc = read_sql_query(text("SELECT account_balance FROM accounts WHERE customer_id = :cid"), params={"cid": cid})
+        if df_acc.empty:
+            st.error("Account not found for customer_id: " + str(cid))
+        else:
+            st.session_state["curr_balance"] = float(df_acc.iloc[0]["account_balance"])
+            st.success(f"Loaded balance: ₹{st.session_state['curr_balance']:.2f}")
+
+    amt = st.number_input("Amount", min_value=0.0, format="%.2f")
+    op = st.selectbox("Operation", ["Deposit", "Withdraw"])
+    if st.button("Execute transaction"):
+        if "curr_balance" not in st.session_state:
+            st.error("Load balance first")
+        else:
+            delta = amt if op == "Deposit" else -amt
+            try:
+                engine = get_engine()
+                with engine.begin() as conn:
+                    # arithmetic and minimum-balance check in one statement: no read-modify-write race
+                    res = conn.execute(text("UPDATE accounts SET account_balance = account_balance + :delta, last_updated = :dt "
+                                            "WHERE customer_id = :cid AND (:delta >= 0 OR account_balance + :delta >= 1000)"),
+                                       {"delta": delta, "dt": datetime.datetime.utcnow().isoformat(), "cid": cid})
+                    newbal = conn.execute(text("SELECT account_balance FROM accounts WHERE customer_id = :cid"),
+                                          {"cid": cid}).scalar()
+                if newbal is None:
+                    st.error("Account not found for customer_id: " + str(cid))
+                else:
+                    st.session_state["curr_balance"] = float(newbal)
+                    if res.rowcount == 0:
+                        st.error("Minimum balance ₹1000 would be violated. Operation aborted.")
+                    else:
+                        invalidate("accounts")
+                        st.success(f"Balance updated: ₹{newbal:.2f}")
+            except Exception as e:
+                st.error("Failed to update balance: " + str(e))
+
+# ---------------------------
+# Page: Analytical Insights
+# ---------------------------
+elif page == "🧠 Analytical Insights":
+    st.header("🧠 Analytical Insights (select a question)")
+    futures = prefetch_insights()
+    selected = st.selectbox("Choose insight", list(SQL_QUERIES.keys()))
+    if selected:
+        q = SQL_QUERIES[selected]
+        st.code(q.text, language="sql")
+        try:
+            dfq = futures[selected].result()
+        except Exception as e:
+            st.error("Query failed: " + str(e))
+        else:
+            if dfq.empty:
+                st.warning("Query returned no rows (or table missing).")
+            else:
+                st.dataframe(dfq)
+                st.download_button("⬇️ Download result as CSV", to_csv_bytes(dfq), "insight.csv", "text/csv")
+
+# ---------------------------
+# Page: About Creator
+# ---------------------------
+elif page == "👩‍💻 About Creator":
+    st.header("About / Contact")
+    st.markdown("""
+    **Creator:** Devendra Kumar
+    
+    **Skills:** Python, SQL, Streamlit, Data Analysis, Banking Analytics
+    
+    **Contact:** devendragkp45@gmail.com
+    """)
+    st.info("This app is a demo. Do not store production PII in a public repo.")
+
+# ---------------------------
+# Sidebar: cache diagnostics (after the page body)
+# ---------------------------
+with cache_diagnostics.container():
+    with st.expander("Cache diagnostics"):
+        stats = st.session_state.get("cache_stats", {})
+        if stats:
+            st.dataframe(pd.DataFrame([
+                {"function": name, "calls": c["calls"], "hits": c["calls"] - c["misses"], "misses": c["misses"]}
+                for name, c in sorted(stats.items())
+            ]), hide_index=True)
+        else:
+            st.caption("No cached reads yet.")
+
+# ---------------------------
+# End of app
+# ---------------------------